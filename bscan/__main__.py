@@ -1,9 +1,8 @@
 """Main entry point for the bscan program."""
 
+import asyncio
 import sys
 
-from sublemon import crossplat_loop_run
-
 from bscan.cli import (
     main as cli_main)
 from bscan.cli_wordlists import (
@@ -12,9 +11,29 @@ from bscan.cli_shells import (
     main as cli_shells_main)
 
 
+def _install_uvloop() -> None:
+    """Install uvloop/winloop as the event loop policy, if available."""
+    # the inline platform check lets mypy see that the Windows-only
+    # event loop policy is only referenced on Windows
+    if sys.platform == 'win32':
+        try:
+            import winloop
+            winloop.install()
+        except ImportError:
+            asyncio.set_event_loop_policy(
+                asyncio.WindowsProactorEventLoopPolicy())
+    else:
+        try:
+            import uvloop
+            uvloop.install()
+        except ImportError:
+            pass
+
+
 def main():
     """The function pointed to by `bscan` in console_scripts."""
-    sys.exit(crossplat_loop_run(cli_main()))
+    _install_uvloop()
+    sys.exit(asyncio.run(cli_main()))
 
 
 def wordlists_main():
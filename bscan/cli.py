@@ -5,23 +5,15 @@ import sys
 
 from argparse import (
     ArgumentParser,
+    ArgumentTypeError,
     Namespace,
     RawTextHelpFormatter)
-from colorama import (
-    init as init_colorama)
-from sublemon import (
-    Sublemon)
+from functools import (
+    lru_cache)
 from typing import (
     List,
-    Optional,
-    Set)
-
-from bscan.config import (
-    init_config,
-    good_py_version,
-    py_version_str)
-from bscan.dir_gen import (
-    create_dir_skeleton)
+    Optional)
+
 from bscan.errors import (
     BscanConfigError,
     BscanError,
@@ -34,37 +26,46 @@ from bscan.io_console import (
     print_e_d1,
     print_i_d1,
     print_w_d1)
-from bscan.networks import (
-    is_valid_hostname,
-    is_valid_ip_host_addr,
-    is_valid_ip_net_addr)
-from bscan.scans import (
-    scan_target)
-from bscan.runtime import (
-    get_db_value,
-    status_update_poller,
-    write_db_value)
 from bscan.version import (
     __version__)
 
 
-def get_parsed_args(args: Optional[List[str]]=None) -> Namespace:
-    """Get the parsed command-line arguments.
+_ERROR_PREFIXES = {
+    BscanConfigError: 'Configuration error: ',
+    BscanInternalError: 'Internal error: ',
+    BscanSubprocessError: 'Error handling subprocess: '}
+"""Console message prefixes for `BscanError` dispatch in `main`."""
 
-    Args:
-        args: Arguments to use in place of `sys.argv`.
+_BANNER = (
+    " _\n"
+    "| |__  ___  ___ __ _ _ __\n"
+    "| '_ \/ __|/ __/ _` | '_ \\\n"
+    "| |_) \__ \ (__ (_| | | | |\n"
+    "|_.__/|___/\___\__,_|_| |_|\n\n"
+    'an asynchronous service enumeration tool')
 
-    """
+
+def _int_at_least(minimum: int):
+    """Build an argparse type for integers with a lower bound."""
+    def _parse(value: str) -> int:
+        try:
+            ivalue = int(value)
+        except ValueError:
+            raise ArgumentTypeError(f'invalid integer value: {value}')
+        if ivalue < minimum:
+            raise ArgumentTypeError(
+                f'must be an integer greater than or equal to {minimum}')
+        return ivalue
+    return _parse
+
+
+@lru_cache(maxsize=1)
+def _build_parser() -> ArgumentParser:
+    """Build the argument parser; cached since it is entirely static."""
     parser = ArgumentParser(
         prog='bscan',
         usage='bscan [OPTIONS] targets',
-        description=(
-            " _\n"
-            "| |__  ___  ___ __ _ _ __\n"
-            "| '_ \/ __|/ __/ _` | '_ \\\n"
-            "| |_) \__ \ (__ (_| | | | |\n"
-            "|_.__/|___/\___\__,_|_| |_|\n\n"
-            'an asynchronous service enumeration tool'),
+        description=_BANNER,
         formatter_class=RawTextHelpFormatter)
 
     parser.add_argument(
@@ -82,6 +83,8 @@ def get_parsed_args(args: Optional[List[str]]=None) -> Namespace:
     parser.add_argument(
         '--cmd-print-width',
         action='store',
+        type=_int_at_least(5),
+        default=80,
         metavar='I',
         help='the maximum integer number of characters allowed when printing\n'
              'the command used to spawn a running subprocess (defaults to 80)')
@@ -104,6 +107,8 @@ def get_parsed_args(args: Optional[List[str]]=None) -> Namespace:
     parser.add_argument(
         '--max-concurrency',
         action='store',
+        type=_int_at_least(1),
+        default=20,
         metavar='I',
         help='maximum integer number of subprocesses permitted to be running\n'
              'concurrently (defaults to 20)')
@@ -163,6 +168,8 @@ def get_parsed_args(args: Optional[List[str]]=None) -> Namespace:
     parser.add_argument(
         '--status-interval',
         action='store',
+        type=int,
+        default=30,
         metavar='I',
         help='integer number of seconds to pause in between printing status\n'
              'updates; a non-positive value disables updates (defaults to 30)')
@@ -212,10 +219,20 @@ def get_parsed_args(args: Optional[List[str]]=None) -> Namespace:
         nargs='*',
         help='the targets and/or networks on which to perform enumeration')
 
+    return parser
+
+
+def get_parsed_args(args: Optional[List[str]]=None) -> Namespace:
+    """Get the parsed command-line arguments.
+
+    Args:
+        args: Arguments to use in place of `sys.argv`.
+
+    """
     if args is None:
         args = sys.argv[1:]
 
-    return parser.parse_args(args)
+    return _build_parser().parse_args(args)
 
 
 async def main(args: Optional[List[str]]=None) -> int:
@@ -229,93 +246,148 @@ async def main(args: Optional[List[str]]=None) -> int:
 
     """
     try:
-        init_colorama()
+        opts = get_parsed_args(args)
+
+        if sys.platform == 'win32':
+            # POSIX terminals interpret ANSI escapes natively; colorama
+            # is only needed to translate them on Windows consoles
+            import colorama
+            colorama.init()
+
+        if not opts.targets:
+            print_e_d1('No targets specified; use `--help` to figure '
+                       'out what you\'re doing')
+            return 1
+
+        # deferred until after argument handling, so `--help`/`--version`/
+        # arg-error/no-target invocations never pay the sublemon/toml
+        # import tax
+        from sublemon import (
+            Sublemon)
+
+        from bscan.config import (
+            init_config,
+            good_py_version,
+            py_version_str)
+        from bscan.dir_gen import (
+            create_dir_skeleton,
+            existing_base_dir_names)
+        from bscan.networks import (
+            classify_target)
+        from bscan.scans import (
+            scan_target)
+        from bscan.runtime import (
+            get_db_value,
+            set_remaining_scan_count,
+            status_update_poller,
+            write_db_value)
 
         if not good_py_version():
-            print_w_d1('Running with Python version ', py_version_str(),
-                       'but this program is only tested with Python 3.6')
+            print_w_d1(f'Running with Python version {py_version_str()} '
+                       'but this program requires Python 3.11 or newer')
+
+        # TODO: create a full list of targets from network address and
+        #       --ping-sweep filtering
+        # order-preserving dedupe; interned targets speed up the
+        # target-keyed dict lookups in `bscan.runtime`
+        unique_targets = [
+            sys.intern(t) for t in dict.fromkeys(opts.targets)]
+        num_dupes = len(opts.targets) - len(unique_targets)
+        if num_dupes > 0:
+            print_w_d1(f'Skipping {num_dupes} duplicate target(s) '
+                       'specified on the command line')
+
+        candidates = []
+        for candidate in unique_targets:
+            kind = classify_target(candidate)
+            if kind == 'net':
+                print_w_d1('Network scanning not yet supported; '
+                           f'skipping network: {candidate}')
+                continue
+            elif kind is None:
+                print_e_d1(f'Unable to parse target {candidate}, '
+                           'skipping it')
+                continue
+
+            candidates.append(candidate)
+
+        if not candidates:
+            print_e_d1('No valid targets specified')
+            return 1
 
-        opts = get_parsed_args(args)
         print_i_d1('Initializing configuration from command-line arguments')
-        mc = opts.max_concurrency
-        try:
-            mc = (20 if mc is None else int(mc))
-            if mc < 1:
-                raise ValueError
-        except ValueError:
-            raise BscanConfigError(
-                'Invalid `--max-concurrency` positive integer value '
-                'received: ' + str(mc))
 
-        async with Sublemon(max_concurrency=mc) as subl:
-            await write_db_value('sublemon', subl)
-            await init_config(opts)
+        async with Sublemon(max_concurrency=opts.max_concurrency) as subl:
+            write_db_value('sublemon', subl)
+
+            # configuration loading stats the wordlist files and reads
+            # the config dir; run it off the event loop's thread so a
+            # slow disk cannot stall startup of the Sublemon server
+            await asyncio.to_thread(init_config, opts)
 
             print_color_info()
 
-            if not opts.targets:
-                print_e_d1('No targets specified; use `--help` to figure '
-                           'out what you\'re doing')
-                return 1
+            # build the directory skeletons concurrently; this is blocking
+            # disk I/O, so it is pushed off of the event loop's thread
+            existing_names = existing_base_dir_names()
+            skeleton_results = await asyncio.gather(
+                *[asyncio.to_thread(
+                    create_dir_skeleton, candidate, existing_names)
+                  for candidate in candidates],
+                return_exceptions=True)
 
-            # TODO: create a full list of targets from network address and
-            #       --ping-sweep filtering
             targets = []
-            _target_set: Set[str] = set()
-            for candidate in opts.targets:
-                if candidate in _target_set:
-                    print_w_d1(
-                        'Target ', candidate, ' has already been added as a '
-                        'target; skipping another attempted addition')
-                    continue
-                elif is_valid_ip_host_addr(candidate):
-                    pass
-                elif is_valid_hostname(candidate):
-                    pass
-                elif is_valid_ip_net_addr(candidate):
-                    print_w_d1('Network scanning not yet supported; '
-                               'skipping network: ', candidate)
-                    continue
+            for candidate, result in zip(candidates, skeleton_results):
+                if isinstance(result, BscanForceSkipTarget):
+                    print_e_d1(
+                        f'{result.message}; {candidate}: skipping this '
+                        'target')
+                elif isinstance(result, Exception):
+                    raise result
                 else:
-                    print_e_d1('Unable to parse target ', candidate,
-                               ', skipping it')
-                    continue
-
-                try:
-                    create_dir_skeleton(candidate)
-                except BscanForceSkipTarget as e:
-                    print_e_d1(e.message)
-                    print_e_d1(candidate, ': skipping this target')
-                    continue
-
-                targets.append(candidate)
-                _target_set.add(candidate)
+                    targets.append(candidate)
 
             if not targets:
                 print_e_d1('No valid targets specified')
                 return 1
 
-            print_i_d1('Kicking off scans of ', len(targets), ' targets')
-            tasks = [scan_target(target) for target in targets]
-            if get_db_value('status-interval') > 0:
-                tasks.append(status_update_poller())
-            await asyncio.gather(*tasks)
+            print_i_d1(f'Kicking off scans of {len(targets)} targets')
+            status_interval = get_db_value('status-interval')
+
+            # gate the scan drivers so that only `--max-concurrency` of
+            # them exist as pending tasks at any one time; the runtime
+            # counts down the full target list so the status poller is
+            # not idled while drivers still wait behind the gate
+            set_remaining_scan_count(len(targets))
+            sem = asyncio.Semaphore(opts.max_concurrency)
+
+            async def _bounded_scan(target: str) -> None:
+                async with sem:
+                    await scan_target(target)
+
+            try:
+                async with asyncio.TaskGroup() as tg:
+                    for target in targets:
+                        tg.create_task(_bounded_scan(target))
+                    if status_interval > 0:
+                        tg.create_task(status_update_poller())
+            except BaseExceptionGroup as eg:
+                # unwrap a lone task failure so the `BscanError` dispatch
+                # below sees it, as it did under the `gather` driver
+                exc: BaseException = eg
+                while (isinstance(exc, BaseExceptionGroup) and
+                        len(exc.exceptions) == 1):
+                    exc = exc.exceptions[0]
+                raise exc from None
 
             print_i_d1('Completed execution')
             return 0
-    except BscanConfigError as e:
-        print_e_d1('Configuration error: ', e.message)
-        return 1
-    except BscanForceSilentExit as e:
-        return 1
-    except BscanInternalError as e:
-        print_e_d1('Internal error: ', e.message)
-        return 1
-    except BscanSubprocessError as e:
-        print_e_d1('Error handling subprocess: ', e.message)
-        return 1
     except BscanError as e:
-        print_e_d1('This should not be reached!')
+        prefix = _ERROR_PREFIXES.get(type(e))
+        if prefix is not None:
+            print_e_d1(prefix, e.message)
+        elif not isinstance(e, BscanForceSilentExit):
+            print_e_d1('This should not be reached!')
         return 1
     except Exception as e:
         print_e_d1('Received unexpected exception; re-raising it.',
@@ -6,6 +6,8 @@ from argparse import (
     ArgumentParser,
     Namespace,
     RawTextHelpFormatter)
+from functools import (
+    lru_cache)
 from typing import (
     List,
     Optional)
@@ -21,13 +23,9 @@ from bscan.version import (
     __version__)
 
 
-def get_parsed_args(args: Optional[List[str]]=None) -> Namespace:
-    """Get the parsed command-line arguments.
-
-    Args:
-        args: Arguments to use in place of `sys.argv`.
-
-    """
+@lru_cache(maxsize=1)
+def _build_parser() -> ArgumentParser:
+    """Build the argument parser; cached since it is entirely static."""
     parser = ArgumentParser(
         prog='bscan-shells',
         usage='bscan-shells [OPTIONS]',
@@ -60,10 +58,20 @@ def get_parsed_args(args: Optional[List[str]]=None) -> Namespace:
         action='store',
         help='the ip or host you want the reverse shell to connect back to')
 
+    return parser
+
+
+def get_parsed_args(args: Optional[List[str]]=None) -> Namespace:
+    """Get the parsed command-line arguments.
+
+    Args:
+        args: Arguments to use in place of `sys.argv`.
+
+    """
     if args is None:
         args = sys.argv[1:]
 
-    return parser.parse_args(args)
+    return _build_parser().parse_args(args)
 
 
 def main(args: Optional[List[str]]=None) -> int:
@@ -74,22 +82,20 @@ def main(args: Optional[List[str]]=None) -> int:
         if not is_valid_ip_host_addr(target) and not is_valid_hostname(target):
             raise BscanConfigError('Invalid target specified: ' + target)
 
-        try:
-            port = (80 if opts.port is None else int(opts.port))
-        except ValueError:
-            raise BscanConfigError('Invalid port specified: ' + opts.port)
+        port_str = opts.port or '80'
+        if not port_str.isdigit() or not 0 < (port := int(port_str)) < 65536:
+            raise BscanConfigError('Invalid port specified: ' + port_str)
 
         if opts.url_encode:
             attr = 'url_encoded_cmd'
         else:
             attr = 'cmd'
 
-        _cmd_iter = sorted(
-            reverse_shell_commands(target, port), key=lambda c: c.name)
-        for rev_shell_cmd in _cmd_iter:
-            print(rev_shell_cmd.name)
-            print(getattr(rev_shell_cmd, attr))
-            print()
+        # already sorted by name at template-load time; aggregated into a
+        # single stdout write rather than three prints per command
+        sys.stdout.write(''.join(
+            f'{cmd.name}\n{getattr(cmd, attr)}\n\n'
+            for cmd in reverse_shell_commands(target, port)))
 
         return 0
     except BscanConfigError as e:
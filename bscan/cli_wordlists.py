@@ -6,6 +6,8 @@ from argparse import (
     ArgumentParser,
     Namespace,
     RawTextHelpFormatter)
+from functools import (
+    lru_cache)
 from typing import (
     List,
     Optional)
@@ -19,13 +21,9 @@ from bscan.wordlists import (
     walk_wordlists)
 
 
-def get_parsed_args(args: Optional[List[str]]=None) -> Namespace:
-    """Get the parsed command-line arguments.
-
-    Args:
-        args: Arguments to use in place of `sys.argv`.
-
-    """
+@lru_cache(maxsize=1)
+def _build_parser() -> ArgumentParser:
+    """Build the argument parser; cached since it is entirely static."""
     parser = ArgumentParser(
         prog='bscan-wordlists',
         usage='bscan-wordlists [OPTIONS]',
@@ -51,10 +49,20 @@ def get_parsed_args(args: Optional[List[str]]=None) -> Namespace:
         version=str(__version__),
         help='program version')
 
+    return parser
+
+
+def get_parsed_args(args: Optional[List[str]]=None) -> Namespace:
+    """Get the parsed command-line arguments.
+
+    Args:
+        args: Arguments to use in place of `sys.argv`.
+
+    """
     if args is None:
         args = sys.argv[1:]
 
-    return parser.parse_args(args)
+    return _build_parser().parse_args(args)
 
 
 def main(args: Optional[List[str]]=None) -> int:
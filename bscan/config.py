@@ -2,19 +2,19 @@
 
 import os
 import re
-import shutil
 import sys
-import toml
 
 from argparse import (
     Namespace)
 from collections import (
     namedtuple)
-from pkg_resources import (
-    resource_string)
+from functools import (
+    lru_cache)
 from typing import (
     Optional)
 
+from bscan.dir_structure import (
+    clear_path_cache)
 from bscan.errors import (
     BscanConfigError)
 from bscan.io_console import (
@@ -22,15 +22,81 @@ from bscan.io_console import (
 from bscan.io_files import (
     dir_exists,
     file_exists)
+from bscan.models import (
+    clear_scan_name_cache,
+    reset_template_globals)
 from bscan.runtime import (
     db,
-    lock)
+    invalidate_config_snapshot,
+    reset_idle_event,
+    snapshot_config)
 
 
 DEFAULT_WORDLIST_SEARCH_DIRS = [
     '/usr/share/wordlists/',
     '/usr/share/seclists/Passwords/']
 
+FILE_OPTIONS = (
+    ('brute-pass-list', 'brute_pass_list',
+     '/usr/share/wordlists/fasttrack.txt'),
+    ('brute-user-list', 'brute_user_list',
+     '/usr/share/wordlists/metasploit/namelist.txt'),
+    ('web-word-list', 'web_word_list',
+     '/usr/share/dirb/wordlists/big.txt'))
+"""File-backed options as (db key, namespace attribute, default) rows."""
+
+_pattern_cache: dict = {}
+"""Compiled pattern matchers, keyed by (file contents, extras)."""
+
+_METACHAR_RE = re.compile(r'[.\\^$*+?{}\[\]|()]')
+"""Pattern for detecting regex metacharacters within a pattern."""
+
+_SMALL_PATTERN_COUNT = 16
+"""Below this count, patterns are kept as individual compiled regexes."""
+
+
+class PatternMatcher:
+    """A multi-pattern matcher over literal and regex patterns.
+
+    Small pattern sets are kept as individually compiled regexes, each a
+    tiny NFA that matches quickly. Larger sets have their literal
+    patterns folded into a single escaped alternation, which cannot
+    backtrack pathologically, with true regex patterns still compiled
+    and run individually.
+
+    """
+
+    def __init__(self, patterns) -> None:
+        if (len(patterns) <= _SMALL_PATTERN_COUNT and
+                not any('|' in p for p in patterns)):
+            self._regexes = [re.compile(p) for p in patterns]
+            return
+
+        literals = [p for p in patterns if not _METACHAR_RE.search(p)]
+        self._regexes = [re.compile(p) for p in patterns
+                         if _METACHAR_RE.search(p)]
+        if literals:
+            self._regexes.insert(
+                0, re.compile('|'.join(re.escape(p) for p in literals)))
+
+    def search(self, line: str) -> bool:
+        """Return whether any configured pattern matches the line."""
+        return any(regex.search(line) for regex in self._regexes)
+
+    def finditer(self, line: str):
+        """Yield non-overlapping matches in position order."""
+        matches: list = []
+        for regex in self._regexes:
+            matches.extend(regex.finditer(line))
+        matches.sort(key=lambda m: (m.start(), -m.end()))
+
+        end = 0
+        for match in matches:
+            if match.start() >= end:
+                yield match
+                end = max(end, match.end())
+
+
 PortScanConfig = namedtuple(
     'PortScanConfig',
     ['name', 'pattern', 'scan'])
@@ -39,7 +105,7 @@ PortScanConfig = namedtuple(
 
 def good_py_version() -> bool:
     """Verify that this program is being run with the expected version."""
-    return sys.version_info.major >= 3 and sys.version_info.minor >= 6
+    return sys.version_info >= (3, 11)
 
 
 def py_version_str() -> str:
@@ -47,6 +113,52 @@ def py_version_str() -> str:
     return str(sys.version_info.major) + '.' + str(sys.version_info.minor)
 
 
+_toml_cache: dict = {}
+"""Parsed TOML documents, keyed by their raw file contents."""
+
+
+@lru_cache(maxsize=4)
+def _executables_on_path(path: str) -> frozenset:
+    """Build the set of executable names present on the given PATH.
+
+    One `os.scandir` pass per PATH entry, rather than a stat per
+    (program, PATH entry) pair as with repeated `shutil.which` calls.
+
+    """
+    found = set()
+    for dirname in path.split(os.pathsep):
+        try:
+            with os.scandir(dirname or os.curdir) as entries:
+                for entry in entries:
+                    try:
+                        if entry.is_file() and entry.stat().st_mode & 0o111:
+                            found.add(entry.name)
+                    except OSError:
+                        continue
+        except OSError:
+            continue
+    return frozenset(found)
+
+
+def parse_toml(contents: str) -> dict:
+    """Parse TOML contents, preferring the stdlib C-backed parser."""
+    try:
+        return _toml_cache[contents]
+    except KeyError:
+        pass
+
+    try:
+        import tomllib
+        parsed = tomllib.loads(contents)
+    except ImportError:
+        import toml
+        parsed = toml.loads(contents)
+
+    _toml_cache[contents] = parsed
+    return parsed
+
+
+@lru_cache(maxsize=32)
 def load_default_config_file(filename: str) -> str:
     """Packaged-friendly method to load contents of a default config file."""
     try:
@@ -57,16 +169,21 @@ def load_default_config_file(filename: str) -> str:
             with open(filepath, 'r') as f:
                 raw_contents = f.read()
         else:
-            # load configuration from either Python wheel or the filesystem
-            raw_contents = resource_string(
-                __name__, 'configuration/' + filename).decode('utf-8')
+            # load configuration from either Python wheel or the filesystem;
+            # deferred import, only the `bscan` entry point needs it
+            from importlib.resources import (
+                files)
+
+            raw_contents = files(__package__).joinpath(
+                'configuration', filename).read_text('utf-8')
     except FileNotFoundError:
         raise BscanConfigError(
-            'Unable to find default configuration file `' + filename + '`')
+            f'Unable to find default configuration file `{filename}`')
 
     return raw_contents
 
 
+@lru_cache(maxsize=32)
 def load_config_file(filename: str, base_dir: Optional[str]=None) -> str:
     """Load config file from specified base_dir, falling back on defaults."""
     if base_dir is None:
@@ -87,169 +204,163 @@ def load_config_file(filename: str, base_dir: Optional[str]=None) -> str:
         return load_default_config_file(filename)
 
 
-async def init_config(ns: Namespace) -> None:
-    """Init configuration from default files and command-line arguments."""
-    async with lock:
-        # track targets being actively scanned
-        db['active-targets'] = set()
+@lru_cache(maxsize=64)
+def _compile_pattern(src: str):
+    """Compile a port-scan parse pattern, cached across init calls."""
+    return re.compile(src)
 
-        # --brute-pass-list
-        if ns.brute_pass_list is None:
-            db['brute-pass-list'] = '/usr/share/wordlists/fasttrack.txt'
-        else:
-            db['brute-pass-list'] = ns.brute_pass_list
-        if not ns.no_file_check and not file_exists(db['brute-pass-list']):
-            raise BscanConfigError(
-                '`--brute-pass-list` file ' + db['brute-pass-list'] +
-                ' does not exist')
 
-        # --brute-user-list
-        if ns.brute_user_list is None:
-            db['brute-user-list'] = (
-                '/usr/share/wordlists/metasploit/namelist.txt')
-        else:
-            db['brute-user-list'] = ns.brute_user_list
-        if not ns.no_file_check and not file_exists(db['brute-user-list']):
-            raise BscanConfigError(
-                '`--brute-user-list` file ' + db['brute-user-list'] +
-                ' does not exist')
+def _resolve_method(kind: str, ns_value: Optional[str],
+                    config: dict) -> PortScanConfig:
+    """Resolve a `--*-method` option against its port-scan configuration."""
+    method = ns_value if ns_value is not None else config['default']
+    if method == 'default' or method not in config:
+        raise BscanConfigError(
+            f'Invalid `--{kind}-method` specified: {method}')
 
-        # --cmd-print-width
-        try:
-            cmd_print_width = (80 if ns.cmd_print_width is None
-                               else int(ns.cmd_print_width))
-            if cmd_print_width < 5:
-                raise ValueError
-        except ValueError:
-            raise BscanConfigError(
-                'Invalid `--cmd-print-width` value specified; must be an '
-                'integer greater than or equal to 5')
-        db['cmd-print-width'] = cmd_print_width
+    attrs = config[method]
+    return PortScanConfig(
+        method,
+        _compile_pattern(attrs['pattern']),
+        attrs['scan'])
 
-        # --output-dir
-        if ns.output_dir is None:
-            db['output-dir'] = os.getcwd()
-        else:
-            db['output-dir'] = ns.output_dir
-        if not dir_exists(db['output-dir']):
-            raise BscanConfigError(
-                '`--output-dir` directory ' + db['output-dir'] +
-                ' does not exist')
 
-        # --patterns; also loads from `configuration/patterns.txt`
-        patterns = load_config_file(
-            'patterns.txt',
-            ns.config_dir).splitlines()
-        if ns.patterns is not None:
-            if not ns.patterns:
-                raise BscanConfigError(
-                    '`--patterns` requires at least one regex pattern')
-            else:
-                patterns.extend(ns.patterns)
-        db['patterns'] = re.compile('|'.join(patterns))
-
-        # --no-program-check
-        if not ns.no_program_check:
-            not_found_progs = []
-            progs = load_config_file(
-                'required-programs.txt',
-                ns.config_dir).splitlines()
-            for prog in progs:
-                if shutil.which(prog) is None:
-                    not_found_progs.append(prog)
-
-            if not_found_progs:
-                raise BscanConfigError(
-                    'required programs ' + ', '.join(not_found_progs) +
-                    ' could not be found on this system')
-
-        # --no-service-scans
-        db['no-service-scans'] = ns.no_service_scans
-
-        # load service information from `configuration/service-scans.toml`
-        db['services'] = toml.loads(
-            load_config_file('service-scans.toml', ns.config_dir))
-
-        # load quick scan method configuration
-        # derived from `--qs-method` + `configuration/port-scans.toml`
-        port_scan_config = toml.loads(
-            load_config_file('port-scans.toml', ns.config_dir))
-        qs_config = port_scan_config['quick']
-        qs_method_name = (ns.qs_method if ns.qs_method is not None else
-                          qs_config['default'])
-        if qs_method_name not in qs_config or qs_method_name == 'default':
-            raise BscanConfigError(
-                'Invalid `--qs-method` specified: ' + str(qs_method_name))
-        qs_attrs = qs_config[qs_method_name]
-        db['quick-scan'] = PortScanConfig(
-            qs_method_name,
-            re.compile(qs_attrs['pattern']),
-            qs_attrs['scan'])
-
-        # load thorough scan method configuration
-        # derived from `--ts-method` + `configuration/port-scans.toml`
-        ts_config = port_scan_config['thorough']
-        ts_method_name = (ns.ts_method if ns.ts_method is not None else
-                          ts_config['default'])
-        if ts_method_name not in ts_config or ts_method_name == 'default':
-            raise BscanConfigError(
-                'Invalid `--ts-method` specified: ' + str(ts_method_name))
-        ts_attrs = ts_config[ts_method_name]
-        db['thorough-scan'] = PortScanConfig(
-            ts_method_name,
-            re.compile(ts_attrs['pattern']),
-            ts_attrs['scan'])
-
-        # load udp scan method configuration
-        # derived from `--udp-method` + `configuration/port-scans.toml`
-        udp_config = port_scan_config['udp']
-        udp_method_name = (ns.udp_method if ns.udp_method is not None else
-                           udp_config['default'])
-        if udp_method_name not in udp_config or udp_method_name == 'default':
-            raise BscanConfigError(
-                'Invalid `--udp-method` specified: ' + str(udp_method_name))
-        udp_attrs = udp_config[udp_method_name]
-        db['udp-scan'] = PortScanConfig(
-            udp_method_name,
-            re.compile(udp_attrs['pattern']),
-            udp_attrs['scan'])
-
-        # --status-interval
-        try:
-            db['status-interval'] = (30 if ns.status_interval is None
-                                     else int(ns.status_interval))
-        except ValueError:
-            raise BscanConfigError(
-                'Invalid `--status-interval` integer specified: ' +
-                str(ns.status_interval))
+def init_config(ns: Namespace) -> None:
+    """Init configuration from default files and command-line arguments.
 
-        # runtime tracking of active subprocesses
-        db['subprocesses'] = dict()
+    Purely CPU-bound dict initialization; writes to the config db are
+    atomic under the GIL, so no event-loop lock is taken.
 
-        # --web-word-list
-        if ns.web_word_list is None:
-            db['web-word-list'] = '/usr/share/dirb/wordlists/big.txt'
-        else:
-            db['web-word-list'] = ns.web_word_list
-        if not ns.no_file_check and not file_exists(db['web-word-list']):
+    """
+    # track targets being actively scanned
+    db['active-targets'] = set()
+    reset_idle_event()
+
+    # drop the previous run's snapshot so a failure partway through this
+    # function cannot leave stale hot-path values behind
+    invalidate_config_snapshot()
+
+    # --brute-pass-list / --brute-user-list / --web-word-list
+    for key, attr, default in FILE_OPTIONS:
+        value = getattr(ns, attr)
+        db[key] = default if value is None else value
+        if not ns.no_file_check and not file_exists(db[key]):
             raise BscanConfigError(
-                '`--web-word-list` file ' + db['web-word-list'] +
-                ' does not exist')
+                f'`--{key}` file {db[key]} does not exist')
 
-        # --quick-only
-        db['quick-only'] = ns.quick_only
+    # --cmd-print-width; validated by the argparse `type=` machinery
+    db['cmd-print-width'] = ns.cmd_print_width
 
-        # --hard
-        db['hard'] = ns.hard
+    # --output-dir
+    if ns.output_dir is None:
+        db['output-dir'] = os.getcwd()
+    else:
+        db['output-dir'] = ns.output_dir
+    if not dir_exists(db['output-dir']):
+        raise BscanConfigError(
+            f"`--output-dir` directory {db['output-dir']} does not exist")
+    clear_path_cache()
+    clear_scan_name_cache()
+    reset_template_globals()
+
+    # --patterns; also loads from `configuration/patterns.txt`
+    raw_patterns = load_config_file('patterns.txt', ns.config_dir)
+    if ns.patterns is not None and not ns.patterns:
+        raise BscanConfigError(
+            '`--patterns` requires at least one regex pattern')
+    extra_patterns = tuple(ns.patterns) if ns.patterns else ()
+    cache_key = (raw_patterns, extra_patterns)
+    try:
+        db['patterns'] = _pattern_cache[cache_key]
+    except KeyError:
+        # drop blank lines, comments, and duplicates (order-preserving)
+        patterns = [p for p in raw_patterns.splitlines()
+                    if p and not p.startswith('#')]
+        patterns.extend(extra_patterns)
+        patterns = list(dict.fromkeys(patterns))
+
+        # validate each pattern on its own so a bad entry is reported
+        # by name rather than as a failure of the combined matcher
+        for pattern in patterns:
+            try:
+                re.compile(pattern)
+            except re.error as e:
+                raise BscanConfigError(
+                    f'Invalid pattern `{pattern}` specified: {e}')
+        db['patterns'] = _pattern_cache[cache_key] = \
+            PatternMatcher(patterns)
+
+    # --no-program-check
+    if not ns.no_program_check:
+        progs = load_config_file(
+            'required-programs.txt',
+            ns.config_dir).splitlines()
+        found_progs = _executables_on_path(
+            os.environ.get('PATH', os.defpath))
+        not_found_progs = [
+            prog for prog in progs if prog not in found_progs]
 
-        # --ping-sweep
-        if ns.ping_sweep:
+        if not_found_progs:
             raise BscanConfigError(
-                '`--ping-sweep` option not yet implemented')
-        db['ping-sweep'] = ns.ping_sweep
+                'required programs ' + ', '.join(not_found_progs) +
+                ' could not be found on this system')
+
+    # --no-service-scans
+    db['no-service-scans'] = ns.no_service_scans
+
+    # load service information from `configuration/service-scans.toml`
+    db['services'] = parse_toml(
+        load_config_file('service-scans.toml', ns.config_dir))
+
+    # reverse index for joining parsed services to their protocol in one
+    # pass rather than scanning every protocol's name list per service
+    db['service-name-to-protocol'] = {
+        name: protocol
+        for protocol, config in db['services'].items()
+        for name in config['nmap-service-names']}
+
+    # freeze each protocol's recommendations once, rather than building
+    # a fresh tuple on every join_services call
+    for config in db['services'].values():
+        config['recommendations'] = tuple(config['recommendations'])
+
+    # load quick scan method configuration
+    # derived from `--qs-method` + `configuration/port-scans.toml`
+    port_scan_config = parse_toml(
+        load_config_file('port-scans.toml', ns.config_dir))
+    db['quick-scan'] = _resolve_method(
+        'qs', ns.qs_method, port_scan_config['quick'])
+
+    # load thorough scan method configuration
+    # derived from `--ts-method` + `configuration/port-scans.toml`
+    db['thorough-scan'] = _resolve_method(
+        'ts', ns.ts_method, port_scan_config['thorough'])
+
+    # load udp scan method configuration
+    # derived from `--udp-method` + `configuration/port-scans.toml`
+    db['udp-scan'] = _resolve_method(
+        'udp', ns.udp_method, port_scan_config['udp'])
+
+    # --status-interval; validated by the argparse `type=` machinery
+    db['status-interval'] = ns.status_interval
+
+    # --quick-only
+    db['quick-only'] = ns.quick_only
+
+    # --hard
+    db['hard'] = ns.hard
+
+    # --ping-sweep
+    if ns.ping_sweep:
+        raise BscanConfigError(
+            '`--ping-sweep` option not yet implemented')
+    db['ping-sweep'] = ns.ping_sweep
+
+    # --udp
+    db['udp'] = ns.udp
 
-        # --udp
-        db['udp'] = ns.udp
+    # --verbose-status
+    db['verbose-status'] = ns.verbose_status
 
-        # --verbose-status
-        db['verbose-status'] = ns.verbose_status
+    # capture the hot-path values read on every spawn and status poll
+    snapshot_config()
@@ -1,5 +1,11 @@
 """Utilities for building `bscan`'s directory strucutre."""
 
+import os
+
+from typing import (
+    Optional,
+    Set)
+
 from bscan.dir_structure import (
     get_base_dir,
     get_local_txt_file,
@@ -15,7 +21,6 @@ from bscan.io_console import (
     print_i_d1,
     print_w_d2)
 from bscan.io_files import (
-    create_dir,
     path_exists,
     remove_dir,
     touch_file)
@@ -23,17 +28,35 @@ from bscan.runtime import (
     get_db_value)
 
 
-def create_dir_skeleton(target: str) -> None:
+def existing_base_dir_names() -> Set[str]:
+    """Enumerate entry names already present in the output directory.
+
+    Computed with a single `os.scandir` call so that per-target existence
+    probes in `create_dir_skeleton` become O(1) set lookups.
+
+    """
+    return set(
+        entry.name for entry in os.scandir(get_db_value('output-dir')))
+
+
+def create_dir_skeleton(target: str,
+                        existing_names: Optional[Set[str]]=None) -> None:
     """Create the directory skeleton for a target-based scan.
 
     Args:
         target: The singular target of the scan.
+        existing_names: Pre-enumerated entry names in the output directory,
+            used in place of a per-target existence syscall.
 
     """
     print_i_d1(target, ': beginning creation of directory structure')
 
     base_dir = get_base_dir(target)
-    if path_exists(base_dir):
+    if existing_names is not None:
+        base_dir_present = os.path.basename(base_dir) in existing_names
+    else:
+        base_dir_present = path_exists(base_dir)
+    if base_dir_present:
         if not get_db_value('hard'):
             raise BscanForceSkipTarget(
                 'Base directory ' + base_dir + ' already exists, use '
@@ -42,23 +65,20 @@ def create_dir_skeleton(target: str) -> None:
         print_w_d2(target, ': removing existing base directory ', base_dir)
         remove_dir(base_dir)
 
-    create_dir(base_dir)
-    notes_file = get_notes_txt_file(target)
-    touch_file(notes_file)
-    recommendations_file = get_recommendations_txt_file(target)
-    touch_file(recommendations_file)
-
-    loot_dir = get_loot_dir(target)
-    create_dir(loot_dir)
-    proof_file = get_proof_txt_file(target)
-    touch_file(proof_file)
-    local_file = get_local_txt_file(target)
-    touch_file(local_file)
-
-    services_dir = get_services_dir(target)
-    create_dir(services_dir)
+    dirs = (
+        get_loot_dir(target),
+        get_services_dir(target),
+        get_sploits_dir(target))
+    files = (
+        get_notes_txt_file(target),
+        get_recommendations_txt_file(target),
+        get_proof_txt_file(target),
+        get_local_txt_file(target))
 
-    sploits_dir = get_sploits_dir(target)
-    create_dir(sploits_dir)
+    # each makedirs call creates the base directory on the way to its leaf
+    for dirname in dirs:
+        os.makedirs(dirname, exist_ok=True)
+    for filename in files:
+        touch_file(filename)
 
     print_i_d1(target, ': successfully completed directory skeleton setup')
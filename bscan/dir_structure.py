@@ -2,50 +2,67 @@
 
 import os
 
+from functools import (
+    lru_cache)
+
 from bscan.runtime import (
     get_db_value)
 
 
+@lru_cache(maxsize=None)
 def get_base_dir(target: str) -> str:
     """Get the path of the base directory for a scan."""
-    return os.path.join(get_db_value('output-dir'), f'{target}.bscan.d')
+    return f"{get_db_value('output-dir')}{os.sep}{target}.bscan.d"
 
 
 def get_notes_txt_file(target: str) -> str:
     """Get the path to the notes.txt file."""
-    return os.path.join(get_base_dir(target), 'notes.txt')
+    return get_base_dir(target) + os.sep + 'notes.txt'
 
 
 def get_recommendations_txt_file(target: str) -> str:
     """Get the path to the recommendations.txt file."""
-    return os.path.join(get_base_dir(target), 'recommendations.txt')
+    return get_base_dir(target) + os.sep + 'recommendations.txt'
 
 
+@lru_cache(maxsize=None)
 def get_services_dir(target: str) -> str:
     """Get the path of the services directory for a scan."""
-    return os.path.join(get_base_dir(target), 'services')
+    return get_base_dir(target) + os.sep + 'services'
 
 
+@lru_cache(maxsize=None)
 def get_sploits_dir(target: str) -> str:
     """Get the path of the sploits  directory for a scan."""
-    return os.path.join(get_base_dir(target), 'sploits')
+    return get_base_dir(target) + os.sep + 'sploits'
 
 
+@lru_cache(maxsize=None)
 def get_loot_dir(target: str) -> str:
     """Get the path of the loot directory for a scan."""
-    return os.path.join(get_base_dir(target), 'loot')
+    return get_base_dir(target) + os.sep + 'loot'
 
 
 def get_proof_txt_file(target: str) -> str:
     """Get the path to the proof.txt proof file."""
-    return os.path.join(get_loot_dir(target), 'proof.txt')
+    return get_loot_dir(target) + os.sep + 'proof.txt'
 
 
 def get_local_txt_file(target: str) -> str:
     """Get the path to the local.txt proof file."""
-    return os.path.join(get_loot_dir(target), 'local.txt')
+    return get_loot_dir(target) + os.sep + 'local.txt'
 
 
 def get_scan_file(target: str, scan_name: str) -> str:
     """Get path to a file for service scan output."""
-    return os.path.join(get_services_dir(target), scan_name)
+    # the cached services dir is already normalized; plain concatenation
+    # skips os.path.join's per-part processing
+    return get_services_dir(target) + os.sep + scan_name
+
+
+def clear_path_cache() -> None:
+    """Invalidate memoized paths; needed when `output-dir` changes."""
+    get_base_dir.cache_clear()
+    get_services_dir.cache_clear()
+    get_sploits_dir.cache_clear()
+    get_loot_dir.cache_clear()
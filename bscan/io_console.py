@@ -1,32 +1,40 @@
 """Utilities for console I/O."""
 
-from colorama import (
-    Fore,
-    Style)
 from functools import (
+    lru_cache,
     partial)
 
+# ANSI escape sequences, matching colorama's Fore/Style constants; POSIX
+# terminals interpret these natively, so colorama itself is only needed
+# for translation on Windows consoles
+_RED = '\x1b[31m'
+_YELLOW = '\x1b[33m'
+_MAGENTA = '\x1b[35m'
+_CYAN = '\x1b[36m'
+_RESET_ALL = '\x1b[0m'
+
 
 def red(s: str) -> str:
     """Add escape sequences to print a string red."""
-    return Fore.RED + s + Style.RESET_ALL
+    return f'{_RED}{s}{_RESET_ALL}'
 
 
 def purple(s: str) -> str:
     """Add escape sequences to print a string purple."""
-    return Fore.MAGENTA + s + Style.RESET_ALL
+    return f'{_MAGENTA}{s}{_RESET_ALL}'
 
 
 def blue(s: str) -> str:
     """Add escape sequences to print a string blue."""
-    return Fore.CYAN + s + Style.RESET_ALL
+    return f'{_CYAN}{s}{_RESET_ALL}'
 
 
 def yellow(s: str) -> str:
     """Add escape sequences to print a string yellow."""
-    return Fore.YELLOW + s + Style.RESET_ALL
+    return f'{_YELLOW}{s}{_RESET_ALL}'
 
 
+@lru_cache(maxsize=1024)
 def shortened_cmd(cmd: str, length: int) -> str:
     """Shorten the command to the specified length."""
     if len(cmd) + 2 <= length:
@@ -46,6 +54,10 @@ print_w_d3 = partial(print, yellow('    [W] '), sep='')
 print_e_d3 = partial(print, red('    [E] '), sep='')
 
 
+_COLOR_INFO_MSG = (
+    'Colors: ' + blue('info') + ', ' + yellow('warnings') + ', ' +
+    red('errors') + ', and ' + purple('pattern matches'))
+
+
 def print_color_info():
-    print_i_d1('Colors: ', blue('info'), ', ', yellow('warnings'), ', ',
-               red('errors'), ', and ', purple('pattern matches'), sep='')
+    print_i_d1(_COLOR_INFO_MSG)
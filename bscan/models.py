@@ -1,29 +1,95 @@
 """Models for use in `bscan` operations."""
 
-from collections import (
-    namedtuple)
+import os
+import re
+
+from dataclasses import (
+    dataclass)
+from functools import (
+    lru_cache)
 from typing import (
-    List)
+    Dict,
+    List,
+    Optional,
+    Tuple)
 
-from bscan.io_files import (
-    file_exists)
 from bscan.runtime import (
     get_db_value)
 from bscan.dir_structure import (
-    get_scan_file)
+    get_scan_file,
+    get_services_dir)
+
+_TOKEN_RE = re.compile(
+    r'<(target|wordlist|userlist|passlist|fout|port|ports)>')
+"""Single-pass matcher for the template tokens in configured commands."""
+
+_existing_scans_cache: dict = {}
+"""Known scan file names per services directory, from one scandir call."""
+
+
+def _existing_scan_names(services_dir: str) -> set:
+    """Enumerate the scan file names already claimed in a services dir."""
+    try:
+        return _existing_scans_cache[services_dir]
+    except KeyError:
+        names = {entry.name for entry in os.scandir(services_dir)}
+        _existing_scans_cache[services_dir] = names
+        return names
+
+
+def clear_scan_name_cache() -> None:
+    """Invalidate enumerated scan names; needed on reconfiguration."""
+    _existing_scans_cache.clear()
+
+
+_template_cache: Optional[Tuple[str, str, str]] = None
+
+
+def _template_globals() -> Tuple[str, str, str]:
+    """Snapshot the wordlist/userlist/passlist template values once."""
+    global _template_cache
+    if _template_cache is None:
+        _template_cache = (
+            get_db_value('web-word-list'),
+            get_db_value('brute-user-list'),
+            get_db_value('brute-pass-list'))
+    return _template_cache
+
 
-ParsedService = namedtuple(
-    'ParsedService',
-    ['name', 'port'])
-"""A class representing a service parsed from unicornscan/nmap outout."""
+def reset_template_globals() -> None:
+    """Invalidate the snapshot; needed when the configuration changes."""
+    global _template_cache
+    _template_cache = None
 
-_DetectedService = namedtuple(
-    '_DetectedService',
-    ['name', 'target', 'ports', 'scans', 'recommendations'])
 
+@lru_cache(maxsize=None)
+def _port_str(ports: Tuple[int, ...]) -> str:
+    """Build the joined port string for an immutable ports tuple."""
+    return ','.join(map(str, ports))
 
-class DetectedService(_DetectedService):
-    """A class for encapsulating a service detected in a scan."""
+
+@dataclass(slots=True, frozen=True)
+class ParsedService:
+    """A class representing a service parsed from unicornscan/nmap outout."""
+
+    name: str
+    port: int
+
+
+@dataclass(slots=True, frozen=True)
+class DetectedService:
+    """A class for encapsulating a service detected in a scan.
+
+    Slotted fields are direct C-level attribute lookups, unlike the
+    property descriptors a namedtuple subclass would go through.
+
+    """
+
+    name: str
+    target: str
+    ports: Tuple[int, ...]
+    scans: Dict[str, str]
+    recommendations: Tuple[str, ...]
 
     def build_scans(self) -> List[str]:
         """Build the scans to be run on this target."""
@@ -41,40 +107,50 @@ class DetectedService(_DetectedService):
 
     def port_str(self) -> str:
         """Build a string representing the ports open for this service."""
-        return ','.join([str(p) for p in self.ports])
+        return _port_str(self.ports)
 
     def _fill_template(self, scan_name, cmd) -> List[str]:
-        """Replace template parameters with values."""
-        cmd = (cmd.replace('<target>', self.target)
-                  .replace('<wordlist>', get_db_value('web-word-list'))
-                  .replace('<userlist>', get_db_value('brute-user-list'))
-                  .replace('<passlist>', get_db_value('brute-pass-list')))
+        """Replace template parameters with values in a single pass."""
+        if '<' not in cmd:
+            # literal commands skip the substitution pipeline entirely
+            return [cmd]
+
+        wordlist, userlist, passlist = _template_globals()
+        subs = {
+            'target': self.target,
+            'wordlist': wordlist,
+            'userlist': userlist,
+            'passlist': passlist}
+
+        def _repl(match) -> str:
+            # unresolvable tokens are left literal
+            return subs.get(match.group(1), match.group(0))
 
         if '<ports>' in cmd:
-            fout = get_scan_file(
+            subs['ports'] = self.port_str()
+            port_dot_str = '.'.join(map(str, self.ports))
+            subs['fout'] = get_scan_file(
                 self.target,
-                self.name + '.' + '.'.join([str(p) for p in self.ports]) +
-                '.' + scan_name)
-            return [cmd.replace('<ports>', self.port_str())
-                       .replace('<fout>', fout)]
+                f'{self.name}.{port_dot_str}.{scan_name}')
+            return [_TOKEN_RE.sub(_repl, cmd)]
         elif '<port>' in cmd:
             cmds = []
             for port in self.ports:
-                fout = get_scan_file(
+                subs['port'] = str(port)
+                subs['fout'] = get_scan_file(
                     self.target,
                     self.name + '.' + str(port) + '.' + scan_name)
-                cmds.append(
-                    cmd.replace('<port>', str(port)).replace('<fout>', fout))
+                cmds.append(_TOKEN_RE.sub(_repl, cmd))
             return cmds
         else:
-            fout = get_scan_file(self.target, self.name + '.' + scan_name)
+            existing = _existing_scan_names(get_services_dir(self.target))
+            basename = self.name + '.' + scan_name
             # handling edge-case where a qs-spawned non-port scan could be
             # overwritten by a ts-spawned non-port scan of the same service
             i = 0
-            while file_exists(fout):
-                fout = get_scan_file(
-                    self.target,
-                    self.name + '.' + str(i) + '.' + scan_name)
+            while basename in existing:
+                basename = self.name + '.' + str(i) + '.' + scan_name
                 i += 1
-            cmd = cmd.replace('<fout>', fout)
-            return [cmd]
+            existing.add(basename)
+            subs['fout'] = get_scan_file(self.target, basename)
+            return [_TOKEN_RE.sub(_repl, cmd)]
@@ -3,7 +3,13 @@
 import ipaddress
 import re
 
+from functools import (
+    lru_cache)
+from typing import (
+    Optional)
 
+
+@lru_cache(maxsize=1024)
 def is_valid_ip_net_addr(ip: str) -> bool:
     """Return whether the address is a valid IPv4 or IPv6 network address."""
     try:
@@ -14,6 +20,7 @@ def is_valid_ip_net_addr(ip: str) -> bool:
     return True
 
 
+@lru_cache(maxsize=1024)
 def is_valid_ip_host_addr(ip: str) -> bool:
     """Return whether the address is a valid IPv4 or IPv6 host address."""
     try:
@@ -24,6 +31,34 @@ def is_valid_ip_host_addr(ip: str) -> bool:
     return True
 
 
+@lru_cache(maxsize=1024)
+def classify_target(candidate: str) -> Optional[str]:
+    """Classify a scan target as a host, a network, or neither.
+
+    Returns:
+        Either `'host'`, `'net'`, or `None` if the candidate could not be
+        classified.
+
+    """
+    try:
+        # a single parse covers both bare addresses and networks; explicit
+        # prefix notation is always a network, even for /32 and /128, so
+        # the slash never leaks into a target's directory paths
+        net = ipaddress.ip_network(candidate, strict=False)
+        if '/' in candidate:
+            return 'net'
+        return 'host' if net.num_addresses == 1 else 'net'
+    except ValueError:
+        pass
+
+    return 'host' if is_valid_hostname(candidate) else None
+
+
+_HOSTNAME_RE = re.compile(
+    r'(?!-)[A-Z\d-]{1,63}(?<!-)'
+    r'(\.(?!-)[A-Z\d-]{1,63}(?<!-))*', re.IGNORECASE)
+
+
 def is_valid_hostname(ho: str) -> bool:
     """Return whether the string is a valid hostname.
 
@@ -33,5 +68,4 @@ def is_valid_hostname(ho: str) -> bool:
     if len(ho) > 255:
         return False
     ho = ho.rstrip('.')
-    allowed = re.compile('(?!-)[A-Z\d-]{1,63}(?<!-)$', re.IGNORECASE)
-    return all(allowed.match(x) for x in ho.split('.'))
+    return _HOSTNAME_RE.fullmatch(ho) is not None
@@ -2,14 +2,13 @@
 
 import asyncio
 
-from asyncio import (
-    Lock)
 from collections import (
     namedtuple)
 from typing import (
     Any,
     AsyncGenerator,
-    Dict)
+    Dict,
+    Optional)
 
 from bscan.errors import (
     BscanInternalError)
@@ -19,10 +18,35 @@ from bscan.io_console import (
     print_w_d3,
     shortened_cmd)
 
+# single-key dict and set mutations are atomic under the GIL, and all
+# access happens on one event-loop thread anyway, so no lock is taken
 db: Dict[str, Any] = dict()
-lock = Lock()
 
-_STATUS_POLL_PERIOD = 0.5
+_idle_event: Optional[asyncio.Event] = None
+"""Event set when the last active target finishes; wakes the poller."""
+
+# snapshot of hot configuration values, taken once per configured run;
+# spawn/poll paths read these module globals instead of re-probing `db`
+_CMD_PRINT_WIDTH: Optional[int] = None
+_SUBLEMON: Any = None
+_STATUS_INTERVAL: Optional[int] = None
+_VERBOSE_STATUS: Optional[bool] = None
+
+
+def snapshot_config() -> None:
+    """Capture hot config values as module globals, once per run."""
+    global _CMD_PRINT_WIDTH, _SUBLEMON, _STATUS_INTERVAL, _VERBOSE_STATUS
+    _CMD_PRINT_WIDTH = db['cmd-print-width']
+    _SUBLEMON = db['sublemon']
+    _STATUS_INTERVAL = db['status-interval']
+    _VERBOSE_STATUS = db['verbose-status']
+
+
+def invalidate_config_snapshot() -> None:
+    """Drop the captured config values; needed on reconfiguration."""
+    global _CMD_PRINT_WIDTH, _SUBLEMON, _STATUS_INTERVAL, _VERBOSE_STATUS
+    _CMD_PRINT_WIDTH = _SUBLEMON = _STATUS_INTERVAL = _VERBOSE_STATUS = None
+
 
 RuntimeStats = namedtuple(
     'RuntimeStats',
@@ -30,53 +54,99 @@ RuntimeStats = namedtuple(
 """An encapsulation of system-wide running subprocess stats."""
 
 
-async def write_db_value(key: str, val: Any) -> None:
+def write_db_value(key: str, val: Any) -> None:
     """Set a database value."""
-    async with lock:
-        db[key] = val
+    db[key] = val
+
+
+_MISSING = object()
 
 
 def get_db_value(key: str) -> Any:
     """Retrieve a database value."""
-    try:
-        return db[key]
-    except KeyError:
+    val = db.get(key, _MISSING)
+    if val is _MISSING:
         raise BscanInternalError(
-            'Attempted to access unknown database key')
+            f'Attempted to access unknown database key `{key}`')
+    return val
+
+
+def reset_idle_event() -> None:
+    """Arm a fresh idle event; needed once per configured run."""
+    global _idle_event
+    _idle_event = asyncio.Event()
+
+
+_remaining_scans: int = 0
+"""Scan drivers yet to finish, including those queued behind the gate."""
+
 
+def set_remaining_scan_count(count: int) -> None:
+    """Record how many scan drivers the current run will execute."""
+    global _remaining_scans
+    _remaining_scans = count
 
-async def add_active_target(target: str) -> None:
+
+def add_active_target(target: str) -> None:
     """Add the specified target as being currently-scanned."""
     target_set = db['active-targets']
     if target in target_set:
         raise BscanInternalError(
-            'Attempted to add already-active target ' + target + ' to set of '
-            'actively-scanned targets')
+            f'Attempted to add already-active target {target} to set '
+            'of actively-scanned targets')
 
-    async with lock:
-        target_set.add(target)
+    target_set.add(target)
+    if _idle_event is not None:
+        _idle_event.clear()
 
 
-async def remove_active_target(target: str) -> None:
+def remove_active_target(target: str) -> None:
     """Remove the specified target as being currently-scanned."""
+    global _remaining_scans
     target_set = db['active-targets']
-    if target not in target_set:
+    try:
+        target_set.remove(target)
+    except KeyError:
         raise BscanInternalError(
-            'Attempted to remove non-active target ' + target + ' from set ' +
+            f'Attempted to remove non-active target {target} from set '
             'of actively-scanned targets')
 
-    async with lock:
-        target_set.remove(target)
+    # the active set drains whenever the concurrency gate empties it,
+    # so only an exhausted scan count means the run is truly idle
+    _remaining_scans -= 1
+    if (_remaining_scans <= 0 and not target_set and
+            _idle_event is not None):
+        _idle_event.set()
+
+
+_STDOUT_CHUNK_SIZE = 8192
 
 
 async def proc_spawn(target: str, cmd: str) -> AsyncGenerator[str, None]:
     """Asynchronously yield lines from stdout of a spawned subprocess."""
-    cmd_len = get_db_value('cmd-print-width')
-    subl = get_db_value('sublemon')
+    cmd_len = _CMD_PRINT_WIDTH
     print_i_d3(target, ': spawning subprocess ', shortened_cmd(cmd, cmd_len))
-    sp, = subl.spawn(cmd)
-    async for line in sp.stdout:
-        yield line.decode('utf-8').strip()
+    sp, = _SUBLEMON.spawn(cmd)
+
+    # read stdout in chunks rather than iterating sublemon's line-wise
+    # generator; chatty scanners emit many lines per chunk, and this
+    # amortizes the event-loop round trip across all of them
+    await sp.wait_running()
+    stdout = sp._subprocess.stdout
+    buf = b''
+    while True:
+        chunk = await stdout.read(_STDOUT_CHUNK_SIZE)
+        if not chunk:
+            break
+        buf += chunk
+        if b'\n' not in chunk:
+            continue
+        lines = buf.split(b'\n')
+        buf = lines.pop()
+        for line in lines:
+            yield line.decode('utf-8').strip()
+    if buf:
+        yield buf.decode('utf-8').strip()
 
     exit_code = await sp.wait_done()
     if exit_code != 0:
@@ -86,39 +156,40 @@ async def proc_spawn(target: str, cmd: str) -> AsyncGenerator[str, None]:
 
 async def status_update_poller() -> None:
     """Coroutine for periodically printing updates about the scan status."""
-    interval = get_db_value('status-interval')
-    verbose = get_db_value('verbose-status')
-    cmd_len = get_db_value('cmd-print-width')
-    if interval <= 0:
+    interval = _STATUS_INTERVAL
+    verbose = _VERBOSE_STATUS
+    cmd_len = _CMD_PRINT_WIDTH
+    if interval is None or interval <= 0:
+        raise BscanInternalError(
+            'Attempted status update polling with non-positive '
+            f'interval of {interval}')
+    if _idle_event is None:
         raise BscanInternalError(
-            'Attempted status update polling with non-positive interval of ' +
-            str(interval))
+            'Attempted status update polling without an armed idle event')
 
-    time_elapsed = float(0)
+    # wake once per interval to print, or immediately on the last
+    # target's removal, rather than busy-polling the active-target count
     while True:
-        await asyncio.sleep(_STATUS_POLL_PERIOD)
-
-        stats: RuntimeStats = get_runtime_stats()
-        if stats.num_active_targets < 1:
+        try:
+            await asyncio.wait_for(_idle_event.wait(), timeout=interval)
             break
+        except asyncio.TimeoutError:
+            pass
 
-        time_elapsed += _STATUS_POLL_PERIOD
-        if time_elapsed >= interval:
-            time_elapsed = float(0)
-            msg = ('Scan status: ' + str(stats.num_total_subprocs) +
-                   ' spawned subprocess(es) currently running across ' +
-                   str(stats.num_active_targets) + ' target(s)')
-            if verbose:
-                subl = db['sublemon']
-                print_i_d2(msg, ', listed below')
-                for sp in subl.running_subprocesses:
-                    print_i_d3(shortened_cmd(sp.cmd, cmd_len))
-            else:
-                print_i_d2(msg)
+        stats: RuntimeStats = get_runtime_stats()
+        msg = ('Scan status: ' + str(stats.num_total_subprocs) +
+               ' spawned subprocess(es) currently running across ' +
+               str(stats.num_active_targets) + ' target(s)')
+        if verbose:
+            print_i_d2(msg, ', listed below')
+            for sp in _SUBLEMON.running_subprocesses:
+                print_i_d3(shortened_cmd(sp.cmd, cmd_len))
+        else:
+            print_i_d2(msg)
 
 
 def get_runtime_stats() -> RuntimeStats:
     """Computer and return the runtime statistics object."""
     return RuntimeStats(
         len(db['active-targets']),
-        len(db['sublemon'].running_subprocesses))
+        len(_SUBLEMON.running_subprocesses))
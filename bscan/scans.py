@@ -1,17 +1,15 @@
 """Target scanning and reporting functionality."""
 
-import re
+import sys
 
 from asyncio import (
     ensure_future,
-    gather)
+    gather,
+    to_thread)
 from itertools import (
     chain)
-from functools import (
-    partial)
 from typing import (
-    Any,
-    Coroutine,
+    Dict,
     List,
     Pattern,
     Set,
@@ -41,7 +39,7 @@ async def scan_target(target: str) -> None:
     """Run quick, thorough, and service scans on a target."""
     do_ts = not get_db_value('quick-only')
     do_s_scans = not get_db_value('no-service-scans')
-    await add_active_target(target)
+    add_active_target(target)
 
     # block on the initial quick scan
     qs_parsed_services = await run_qs(target)
@@ -50,13 +48,14 @@ async def scan_target(target: str) -> None:
     _print_matched_services(target, qs_joined_services)
     _print_unmatched_services(target, qs_unmatched_services)
 
-    # schedule service scans based on qs-found ports
+    # schedule service scans based on qs-found ports; each task is
+    # created as its command is built so the scans overlap the upcoming
+    # thorough scan
     if do_s_scans:
-        qs_s_scan_cmds: List[List[str]] = \
-            [js.build_scans() for js in qs_joined_services]
-        qs_s_scans: List[Coroutine[Any, Any, Any]] = \
-            [run_service_s(target, cmd) for cmd in chain(*qs_s_scan_cmds)]
-        qs_s_scan_tasks = [ensure_future(scan) for scan in qs_s_scans]
+        qs_s_scan_tasks = [
+            ensure_future(run_service_s(target, cmd))
+            for js in qs_joined_services
+            for cmd in js.build_scans()]
     else:
         qs_s_scan_tasks = []
 
@@ -75,10 +74,10 @@ async def scan_target(target: str) -> None:
             join_services(target, new_services)
         _print_matched_services(target, ts_joined_services)
         _print_unmatched_services(target, ts_unmatched_services)
-        ts_s_scan_cmds = [js.build_scans() for js in ts_joined_services]
-        ts_s_scans = [run_service_s(target, cmd) for
-                      cmd in chain(*ts_s_scan_cmds)]
-        ts_s_scan_tasks = [ensure_future(scan) for scan in ts_s_scans]
+        ts_s_scan_tasks = [
+            ensure_future(run_service_s(target, cmd))
+            for js in ts_joined_services
+            for cmd in js.build_scans()]
     elif do_ts:
         print_i_d2(target, ': thorough scan discovered no additional '
                    'services')
@@ -86,21 +85,23 @@ async def scan_target(target: str) -> None:
     else:
         ts_s_scan_tasks = []
 
-    # write recommendations file for further manual TCP commands
+    # write recommendations file for further manual TCP commands; the
+    # sections are built up front so the file is opened and written once
+    rec_lines: List[str] = []
     for js in chain(qs_joined_services, ts_joined_services):
         if not js.recommendations:
             continue
 
-        with open(get_recommendations_txt_file(js.target), 'a') as f:
-            fprint = partial(print, file=f, sep='')
-            section_header = (
-                'The following commands are recommended for service ' +
-                js.name + ' running on port(s) ' + js.port_str() + ':')
-            fprint(section_header)
-            fprint('-'*len(section_header))
-            for rec in js.build_recommendations():
-                fprint(rec)
-            fprint()
+        section_header = (
+            f'The following commands are recommended for service {js.name} '
+            f'running on port(s) {js.port_str()}:')
+        rec_lines.append(section_header)
+        rec_lines.append('-'*len(section_header))
+        rec_lines.extend(js.build_recommendations())
+        rec_lines.append('')
+    if rec_lines:
+        # blocking disk write; keep it off the event loop's thread
+        await to_thread(_write_recommendations, target, rec_lines)
 
     # run UDP scan
     if get_db_value('udp'):
@@ -113,7 +114,7 @@ async def scan_target(target: str) -> None:
     # block on any pending service scan tasks
     await gather(*chain(qs_s_scan_tasks, ts_s_scan_tasks))
 
-    await remove_active_target(target)
+    remove_active_target(target)
 
 
 async def run_qs(target: str) -> Set[ParsedService]:
@@ -130,8 +131,9 @@ async def run_qs(target: str) -> Set[ParsedService]:
 
 async def run_service_s(target: str, cmd: str) -> None:
     """Run an in-depth service scan on the specified target."""
+    patterns = get_db_value('patterns')
     async for line in proc_spawn(target, cmd):
-        highlight_patterns(target, line)
+        highlight_patterns(target, line, patterns)
 
 
 async def run_ts(target: str) -> Set[ParsedService]:
@@ -158,6 +160,12 @@ async def run_udp_s(target: str) -> Set[ParsedService]:
     return services
 
 
+def _write_recommendations(target: str, lines: List[str]) -> None:
+    """Append the built recommendation sections to the target's file."""
+    with open(get_recommendations_txt_file(target), 'a') as f:
+        f.write('\n'.join(lines) + '\n')
+
+
 def join_services(target: str,
                   services: Set[ParsedService]) ->\
                   Tuple[Set[ParsedService], List[DetectedService]]:
@@ -169,40 +177,60 @@ def join_services(target: str,
 
     """
     defined_services = get_db_value('services')
-    unmatched_services = services.copy()
+    name_to_protocol = get_db_value('service-name-to-protocol')
+
+    # one bucketing pass over the parsed services via the reverse index,
+    # rather than a scan of every protocol's name list per service
+    unmatched_services = set()
+    ports_by_protocol: Dict[str, List[int]] = {}
+    for service in services:
+        protocol = name_to_protocol.get(service.name)
+        if protocol is None:
+            unmatched_services.add(service)
+        else:
+            ports_by_protocol.setdefault(protocol, []).append(service.port)
+
     joined_services = []
-    for protocol, config in defined_services.items():
-        matches = [s for s in services if s.name in
-                   config['nmap-service-names']]
-        if matches:
-            ds = DetectedService(
+    for protocol, ports in ports_by_protocol.items():
+        ports.sort()
+        config = defined_services[protocol]
+        joined_services.append(
+            DetectedService(
                 protocol,
                 target,
-                tuple(sorted(s.port for s in matches)),
+                tuple(ports),
                 config['scans'],
-                tuple(config['recommendations']))
-            joined_services.append(ds)
-            unmatched_services -= set(matches)
+                config['recommendations']))
 
     return unmatched_services, joined_services
 
 
-def highlight_patterns(target: str, line: str) -> None:
-    """Print a string with configured pattern matches highlighted in purple."""
-    patterns = get_db_value('patterns')
+def highlight_patterns(target: str, line: str, patterns=None) -> None:
+    """Print a string with configured pattern matches highlighted in purple.
+
+    Per-line callers pass the matcher in, hoisting the db lookup out of
+    their stdout loops.
+
+    """
+    if patterns is None:
+        patterns = get_db_value('patterns')
+
+    # the overwhelming majority of lines match nothing; a plain search
+    # bails out before any of the finditer merge machinery is set up
+    if not patterns.search(line):
+        return
+
     pos = 0
-    highlighted_line = ''
-    did_match = False
-    for match in re.finditer(patterns, line):
-        did_match = True
-        highlighted_line += line[pos:match.start()]
-        highlighted_line += purple(match.group(0))
+    parts = []
+    for match in patterns.finditer(line):
+        parts.append(line[pos:match.start()])
+        parts.append(purple(match.group(0)))
         pos = match.end()
 
-    if did_match:
-        highlighted_line += line[pos:]
+    if parts:
+        parts.append(line[pos:])
         print_i_d3(
-            target, ': matched pattern in line `', highlighted_line, '`')
+            target, ': matched pattern in line `', ''.join(parts), '`')
 
 
 async def _parse_port_scan(
@@ -210,14 +238,17 @@ async def _parse_port_scan(
         cmd: str,
         pattern: Pattern) -> Set[ParsedService]:
     """Parse the output of a port scan command."""
+    patterns = get_db_value('patterns')
     services = set()
     async for line in proc_spawn(target, cmd):
-        highlight_patterns(target, line)
-        parse_match = re.search(pattern, line)
+        highlight_patterns(target, line, patterns)
+        parse_match = pattern.search(line)
         if parse_match:
+            # interning shares one str across every sighting of a
+            # service name, cheapening the hash/eq work in set diffs
             services.add(
                 ParsedService(
-                    parse_match.group('name'),
+                    sys.intern(parse_match.group('name')),
                     int(parse_match.group('port'))))
     return services
 
@@ -1,31 +1,49 @@
 """Utilities for loading reverse shell commands from the configuration file."""
 
-import toml
+import re
 
 from collections import (
     namedtuple)
+from functools import (
+    lru_cache)
 from typing import (
-    List)
+    List,
+    Tuple)
 from urllib.parse import (
     quote_plus)
 
-from bscan.config import load_default_config_file
+from bscan.config import (
+    load_default_config_file,
+    parse_toml)
 
 ReverseShellCommand = namedtuple(
     'ReverseShellCommand',
     ['name', 'cmd', 'url_encoded_cmd'])
 
+_TOKEN_RE = re.compile(r'<(target|port)>')
+"""Single-pass matcher for the tokens in shell command templates."""
+
+
+@lru_cache(maxsize=1)
+def _load_shell_templates() -> Tuple[dict, ...]:
+    """Load the raw shell templates once, pre-sorted by name."""
+    config_contents = load_default_config_file('reverse-shells.toml')
+    return tuple(sorted(
+        parse_toml(config_contents)['shells'],
+        key=lambda template: template['name']))
+
 
 def reverse_shell_commands(
         target: str, port: int) -> List[ReverseShellCommand]:
     """Generate reverse shell commands from default configuration."""
+    subs = {'target': target, 'port': str(port)}
     rev_shell_cmds = []
-    config_contents = load_default_config_file('reverse-shells.toml')
-    for unparsed in toml.loads(config_contents)['shells']:
-        cmd = (unparsed['cmd'].replace('<target>', target)
-                              .replace('<port>', str(port)))
+    for template in _load_shell_templates():
+        # one pass over the template; the commands are full of literal
+        # `$`s, which rules out string.Template here
+        cmd = _TOKEN_RE.sub(lambda m: subs[m.group(1)], template['cmd'])
         parsed = ReverseShellCommand(
-            unparsed['name'],
+            template['name'],
             cmd,
             quote_plus(cmd))
         rev_shell_cmds.append(parsed)
@@ -2,28 +2,78 @@
 
 import fnmatch
 import os
+import re
+import sys
 
+from functools import (
+    lru_cache)
 from typing import (
-    List)
+    Iterator,
+    List,
+    Tuple)
+
+
+@lru_cache(maxsize=128)
+def _compile_glob(fnpattern: str):
+    """Translate and compile a glob pattern once per unique pattern."""
+    return re.compile(fnmatch.translate(fnpattern))
+
+
+def _scan_tree(path: str) -> Iterator[Tuple[str, List[os.DirEntry]]]:
+    """Yield (directory path, file entries) pairs beneath a path.
+
+    Built on `os.scandir` so directory-vs-file decisions reuse the type
+    reported by `readdir`, rather than the fresh `stat` per entry that
+    `os.walk` callers end up paying.
+
+    """
+    try:
+        with os.scandir(path) as entry_iter:
+            entries = list(entry_iter)
+    except OSError:
+        return
+
+    files = []
+    subdirs = []
+    for entry in entries:
+        try:
+            if entry.is_dir(follow_symlinks=True):
+                subdirs.append(entry.path)
+            else:
+                files.append(entry)
+        except OSError:
+            continue
+
+    yield path, files
+    for subdir in subdirs:
+        yield from _scan_tree(subdir)
 
 
 def find_wordlist(wordlist_dirs: List[str], fnpattern: str) -> None:
     """Recursively search wordlist directories for a specified filename."""
+    # translating the glob once up front avoids fnmatch.filter's
+    # per-directory re-translation of the same pattern
+    match = _compile_glob(fnpattern).match
     for wordlist_dir in wordlist_dirs:
-        _walk_iter = os.walk(wordlist_dir, followlinks=True)
-        for dirpath, dirnames, filenames in _walk_iter:
-            for match in fnmatch.filter(filenames, fnpattern):
-                print(os.path.join(dirpath, match))
+        for dirpath, file_entries in _scan_tree(wordlist_dir):
+            for entry in file_entries:
+                if match(entry.name):
+                    # DirEntry.path is built during the scan; no
+                    # os.path.join needed here
+                    print(entry.path)
 
 
 def walk_wordlists(wordlist_dirs: List[str]) -> None:
     """Recursively walk the wordlist directories and print all files."""
+    # writing pre-encoded bytes to the underlying buffer skips the
+    # TextIOWrapper layer on top of the one write per directory
+    write = sys.stdout.buffer.write
     for wordlist_dir in wordlist_dirs:
-        _walk_iter = os.walk(wordlist_dir, followlinks=True)
-        for dirpath, dirnames, filenames in _walk_iter:
-            if not filenames:
+        for dirpath, file_entries in _scan_tree(wordlist_dir):
+            if not file_entries:
                 continue
-            print(dirpath)
-            for filename in filenames:
-                print(filename)
-            print()
+            write((
+                dirpath + '\n' +
+                '\n'.join(entry.name for entry in file_entries) +
+                '\n\n').encode())
+    sys.stdout.buffer.flush()
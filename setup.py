@@ -1,19 +1,25 @@
 """Setup configuration for the `bscan` program."""
 
-import codecs
+import ast
 import os
 
 from setuptools import (
-    find_packages,
     setup)
 
 HERE = os.path.abspath(os.path.dirname(__file__))
 BSCAN_DIR = os.path.join(HERE, 'bscan')
 VERSION_FILE = os.path.join(BSCAN_DIR, 'version.py')
 
-with codecs.open(VERSION_FILE, encoding='utf-8') as f:
-    exec(f.read())
-    version = __version__  # noqa
+# pull the version tuple out of its assignment line rather than
+# exec-ing the whole module at install time
+with open(VERSION_FILE, encoding='utf-8') as f:
+    for line in f:
+        if line.startswith('__version_info__'):
+            version_info = ast.literal_eval(line.split('=', 1)[1].strip())
+            version = '.'.join(str(i) for i in version_info)
+            break
+    else:
+        raise RuntimeError('Unable to find version info in ' + VERSION_FILE)
 
 setup(
     name='bscan',
@@ -24,8 +30,14 @@ setup(
     author_email='welch18@vt.edu',
     url='https://github.com/welchbj/bscan',
     license='MIT',
+    python_requires='>=3.11',
     install_requires=['colorama', 'sublemon', 'toml'],
-    packages=find_packages(exclude=['tests', '*.tests', '*.tests.*']),
+    extras_require={
+        'fast': [
+            'uvloop;platform_system!="Windows"',
+            'winloop;platform_system=="Windows"']
+    },
+    packages=['bscan'],
     include_package_data=True,
     entry_points={
         'console_scripts': [
@@ -38,7 +50,7 @@ setup(
         'Environment :: Console',
         'License :: OSI Approved :: MIT License',
         'Operating System :: POSIX',
-        'Programming Language :: Python :: 3.6',
+        'Programming Language :: Python :: 3.11',
         'Topic :: Utilities'
     ]
 )